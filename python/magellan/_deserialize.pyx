@@ -0,0 +1,41 @@
+#
+# Copyright 2015 Ram Sriharsha
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Optional Cython accelerator for the row-oriented deserialize path in
+magellan.types. The pure Python fallback converts a list of vertex rows
+through np.asarray; this walks the list in C and writes the coordinates
+straight into a preallocated (N, 2) float64 buffer.
+"""
+
+import numpy as np
+
+cimport numpy as np
+
+
+def points_to_xy(list rows):
+    """
+    Converts a list of (x, y) vertex rows into an (N, 2) float64 array.
+    """
+    cdef Py_ssize_t n = len(rows)
+    cdef Py_ssize_t i
+    cdef object row
+    cdef np.ndarray[np.float64_t, ndim=2] out = np.empty((n, 2), dtype=np.float64)
+    for i in range(n):
+        row = rows[i]
+        out[i, 0] = row[0]
+        out[i, 1] = row[1]
+    return out
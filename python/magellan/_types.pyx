@@ -0,0 +1,51 @@
+#
+# Copyright 2015 Ram Sriharsha
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Optional Cython accelerator for magellan.types.
+
+CPoint mirrors the API of the pure Python Point but stores its
+coordinates as unboxed C doubles, so a vertex is a fixed 16 byte struct
+and attribute access is a plain struct load instead of a boxed float
+lookup. A cdef class cannot extend pyspark's DataType, so CPoint does
+not replace Point in the UDT machinery; it is an opt-in vertex type for
+kernels that iterate x/y in tight loops.
+"""
+
+
+cdef class CPoint:
+
+    cdef public double x, y
+
+    def __init__(self, double x = 0.0, double y = 0.0):
+        self.x = x
+        self.y = y
+
+    def __str__(self):
+        return "Point (" + str(self.x) + "," + str(self.y) + ")"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __reduce__(self):
+        return (CPoint, (self.x, self.y))
+
+    def __eq__(self, other):
+        return isinstance(other, CPoint) and \
+            self.x == (<CPoint> other).x and self.y == (<CPoint> other).y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
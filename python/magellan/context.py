@@ -16,7 +16,7 @@
 
 import sys
 
-from magellan.types import Point, Polygon, PolyLine
+from magellan.types import Shape, Point, Polygon, PolyLine
 from pyspark import SparkContext
 from pyspark.rdd import RDD
 from pyspark.serializers import PickleSerializer, AutoBatchedSerializer
@@ -29,17 +29,7 @@ _acceptable_types[type(Point())] =  (type(Point()),)
 _acceptable_types[type(Polygon())] = (type(Polygon()),)
 _acceptable_types[type(PolyLine())] = (type(PolyLine()),)
 
-sc = SparkContext._active_spark_context
-loader = sc._jvm.Thread.currentThread().getContextClassLoader()
-wclass = loader.loadClass("org.apache.spark.sql.magellan.EvaluatePython")
-wmethod = None
-for mthd in wclass.getMethods():
-    if mthd.getName() == "registerPicklers":
-        wmethod = mthd
-
-expr_class = sc._jvm.java.lang.Object
-java_args = sc._gateway.new_array(expr_class, 0)
-wmethod.invoke(None, java_args)
+Shape.registerPicklers()
 
 class MagellanContext(SQLContext):
     """A variant of Spark SQL that integrates with spatial data.
@@ -15,9 +15,10 @@
 #
 
 import json
+import pickle
 import sys
 
-from itertools import izip
+import numpy as np
 
 from pyspark import SparkContext
 from pyspark.sql.types import DataType, UserDefinedType, StructField, StructType, \
@@ -34,9 +35,52 @@ except:
     # No Shapely in environment, but that's okay
     _have_shapely = False
 
+try:
+    import pyarrow as pa
+    _have_arrow = True
+except:
+    # No Arrow in environment, but that's okay
+    _have_arrow = False
+
+try:
+    from magellan._deserialize import points_to_xy as _points_to_xy
+except ImportError:
+    # No compiled accelerator: deserialize falls back to np.asarray
+    _points_to_xy = None
+
 
 class Shape(DataType):
 
+    __slots__ = ()
+
+    __initialized__ = False
+
+    _register_method = None
+
+    @staticmethod
+    def registerPicklers():
+        """
+        Registers the JVM side picklers for magellan shapes. The actual
+        registration crosses the Py4J gateway, so it runs at most once;
+        subsequent calls are a single class-attribute check.
+        """
+        if Shape.__initialized__:
+            return
+        sc = SparkContext._active_spark_context
+        if sc is None:
+            # No active SparkContext (e.g. jsonValue called while building a
+            # schema on the driver before startup): registration happens
+            # later, at the latest when magellan.context is imported.
+            return
+        if Shape._register_method is None:
+            loader = sc._jvm.Thread.currentThread().getContextClassLoader()
+            wclass = loader.loadClass("org.apache.spark.sql.magellan.EvaluatePython")
+            no_params = sc._gateway.new_array(sc._jvm.java.lang.Class, 0)
+            Shape._register_method = wclass.getMethod("registerPicklers", no_params)
+        java_args = sc._gateway.new_array(sc._jvm.java.lang.Object, 0)
+        Shape._register_method.invoke(None, java_args)
+        Shape.__initialized__ = True
+
     def convert(self):
         raise NotImplementedError()
 
@@ -47,6 +91,48 @@ class Shape(DataType):
             raise TypeError("Cannot convert to Shapely type")
 
 
+def _as_xy(points):
+    """
+    Coerces a sequence of vertices into a C-contiguous (N, 2) float64 array.
+    Accepts an ndarray or buffer of packed coordinates, a sequence of
+    (x, y) pairs, or the legacy list of :class:`Point` objects.
+    """
+    if isinstance(points, np.ndarray):
+        xy = points.reshape(-1, 2)
+    elif len(points) > 0 and isinstance(points[0], Point):
+        xy = np.array([(point.x, point.y) for point in points])
+    else:
+        xy = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return np.ascontiguousarray(xy, dtype=np.float64)
+
+
+class _PointView(object):
+    """
+    A lazy sequence view over an (N, 2) coordinate buffer.
+    Synthesizes :class:`Point` objects on demand so that indexing or
+    iterating the vertices of a shape does not materialize one Python
+    object per vertex up front.
+    """
+
+    __slots__ = ('_xy',)
+
+    def __init__(self, xy):
+        self._xy = xy
+
+    def __len__(self):
+        return len(self._xy)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Point(x, y) for x, y in self._xy[index]]
+        x, y = self._xy[index]
+        return Point(x, y)
+
+    def __iter__(self):
+        for x, y in self._xy:
+            yield Point(x, y)
+
+
 class PointUDT(UserDefinedType):
     """User-defined type (UDT).
 
@@ -75,20 +161,21 @@ class PointUDT(UserDefinedType):
         """
         Converts the a user-type object into a SQL datum.
         """
-        if isinstance(obj, Point):
+        if type(obj) is Point:
             return obj
         else:
             raise TypeError("cannot serialize %r of type %r" % (obj, type(obj)))
 
-    def deserialize(self, datum):
+    def deserialize(self, datum, _len=len):
         """
         Converts a SQL datum into a user-type object.
         """
         if isinstance(datum, Point):
             return datum
         else:
-            assert len(datum) == 2, \
-                "PointUDT.deserialize given row with length %d but requires 2" % len(datum)
+            if __debug__:
+                assert _len(datum) == 2, \
+                    "PointUDT.deserialize given row with length %d but requires 2" % _len(datum)
             return Point(datum[0], datum[1])
 
     def simpleString(self):
@@ -98,6 +185,55 @@ class PointUDT(UserDefinedType):
     def fromJson(cls, json):
         return Point(json['x'], json['y'])
 
+    arrowExtensionName = "geoarrow.point"
+
+    @classmethod
+    def arrowType(cls):
+        """
+        The Arrow storage type for this UDT: a struct of two float64
+        columns, per the geoarrow point layout.
+        """
+        if _have_arrow:
+            return pa.struct([pa.field('x', pa.float64()),
+                              pa.field('y', pa.float64())])
+        else:
+            raise TypeError("Cannot convert to Arrow type")
+
+    @classmethod
+    def arrowField(cls, name):
+        """
+        An Arrow field of this UDT's storage type, tagged with the
+        geoarrow extension name.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return pa.field(name, cls.arrowType(),
+                        metadata={"ARROW:extension:name": cls.arrowExtensionName})
+
+    def toArrow(self, points):
+        """
+        Converts a :class:`PointArray` or a sequence of points into an
+        Arrow struct array, bypassing the per-row serialize path.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        if not isinstance(points, PointArray):
+            xy = _as_xy(points if isinstance(points, np.ndarray) else list(points))
+            points = PointArray(np.ascontiguousarray(xy[:, 0]),
+                                np.ascontiguousarray(xy[:, 1]))
+        return points.toArrow()
+
+    @classmethod
+    def fromArrow(cls, array):
+        """
+        Wraps an Arrow struct array of points as a :class:`PointArray`
+        without copying the underlying buffers.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return PointArray(array.field('x').to_numpy(zero_copy_only=True),
+                          array.field('y').to_numpy(zero_copy_only=True))
+
 
 class Point(Shape):
     """
@@ -112,6 +248,8 @@ class Point(Shape):
     Point([1.0, 2.0])
     """
 
+    __slots__ = ('x', 'y')
+
     __UDT__ = PointUDT()
 
     def __init__(self, x = 0.0, y = 0.0):
@@ -119,40 +257,44 @@ class Point(Shape):
         self.y = y
 
     def __str__(self):
-        return "Point (" + str(self.x) + "," + str(self.y) + ")"
+        return "Point (%s,%s)" % (self.x, self.y)
 
     def __repr__(self):
         return self.__str__()
 
-    def __unicode__(self):
-        return self.__str__()
-
     def __reduce__(self):
         return (Point, (self.x, self.y))
 
     def __eq__(self, other):
-        return isinstance(other, Point) and self.x == other.x and self.y == other.y
+        return self is other or \
+            (type(other) is Point and self.x == other.x and self.y == other.y)
+
+    def __hash__(self):
+        return hash((self.x, self.y))
 
     @classmethod
     def fromJson(cls, json):
         return Point(json['x'], json['y'])
 
     def jsonValue(self):
-        return {"type": "udt",
-                "pyClass": "magellan.types.PointUDT",
-                "class": "magellan.PointUDT",
-                "sqlType": "magellan.Point"}
+        Shape.registerPicklers()
+        return _POINT_JSON
 
     def convert(self):
         return SPoint(self.x, self.y)
 
 
+# Shared singleton: the UDTs are stateless, so every consumer can use the
+# same instance instead of constructing one per class or per call.
+_POINT_UDT = PointUDT()
+
+
 class PolygonUDT(UserDefinedType):
     """User-defined type (UDT).
 
     .. note:: WARN: SpatialSDK Internal Use Only
     """
-    pointUDT = PointUDT()
+    pointUDT = _POINT_UDT
 
     @classmethod
     def sqlType(cls):
@@ -179,21 +321,28 @@ class PolygonUDT(UserDefinedType):
         """
         Converts the a user-type object into a SQL datum.
         """
-        if isinstance(obj, Polygon):
+        if type(obj) is Polygon:
             return obj
         else:
             raise TypeError("cannot serialize %r of type %r" % (obj, type(obj)))
 
-    def deserialize(self, datum):
+    def deserialize(self, datum, _len=len):
         """
         Converts a SQL datum into a user-type object.
         """
         if isinstance(datum, Polygon):
             return datum
         else:
-            assert len(datum) == 2, \
-                "PolygonUDT.deserialize given row with length %d but requires 2" % len(datum)
-            return Polygon(datum[0], [self.pointUDT.deserialize(point) for point in datum[1]])
+            if __debug__:
+                assert _len(datum) == 2, \
+                    "PolygonUDT.deserialize given row with length %d but requires 2" % _len(datum)
+            points = datum[1]
+            if isinstance(points, (bytes, bytearray, memoryview)):
+                points = np.frombuffer(points, dtype=np.float64)
+            elif (_points_to_xy is not None and type(points) is list
+                    and len(points) > 0 and not isinstance(points[0], Point)):
+                points = _points_to_xy(points)
+            return Polygon(datum[0], points)
 
     def simpleString(self):
         return 'polygon'
@@ -204,6 +353,56 @@ class PolygonUDT(UserDefinedType):
         points = [PointUDT.fromJson(point) for point in json["points"]]
         return Polygon(indices, points)
 
+    arrowExtensionName = "geoarrow.polygon"
+
+    @classmethod
+    def arrowType(cls):
+        """
+        The Arrow storage type for this UDT: a list of rings, each a
+        list of coordinate structs, per the geoarrow polygon layout.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return pa.list_(pa.list_(PointUDT.arrowType()))
+
+    @classmethod
+    def arrowField(cls, name):
+        """
+        An Arrow field of this UDT's storage type, tagged with the
+        geoarrow extension name.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return pa.field(name, cls.arrowType(),
+                        metadata={"ARROW:extension:name": cls.arrowExtensionName})
+
+    def toArrow(self, polygons):
+        """
+        Converts a :class:`PolygonArray` or a sequence of polygons into
+        a nested Arrow list array, bypassing the per-row serialize path.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        if not isinstance(polygons, PolygonArray):
+            polygons = PolygonArrayUDT().deserialize(
+                [(polygon.indices.tolist(), polygon._xy) for polygon in polygons])
+        return polygons.toArrow()
+
+    @classmethod
+    def fromArrow(cls, array):
+        """
+        Wraps a nested Arrow list array of polygons as a
+        :class:`PolygonArray` without copying the underlying buffers.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        rings = array.values
+        coords = rings.values
+        return PolygonArray(coords.field('x').to_numpy(zero_copy_only=True),
+                            coords.field('y').to_numpy(zero_copy_only=True),
+                            rings.offsets.to_numpy(zero_copy_only=True),
+                            array.offsets.to_numpy(zero_copy_only=True))
+
 
 class Polygon(Shape):
     """
@@ -219,22 +418,95 @@ class Polygon(Shape):
     Point([-1.0,-1.0, 1.0, 1.0], [0], Point(1.0, 1.0), Point(1.0, -1.0), Point(1.0, 1.0))
     """
 
+    __slots__ = ('indices', '_xy')
+
     __UDT__ = PolygonUDT()
 
-    def __init__(self, indices = [], points = []):
-        self.indices = indices
-        self.points = points
+    def __init__(self, indices = None, points = None):
+        self.indices = np.asarray(() if indices is None else indices,
+                                  dtype=np.int32)
+        self._xy = _as_xy(() if points is None else points)
+
+    @classmethod
+    def from_xy(cls, indices, xs, ys):
+        """
+        Builds a polygon directly from parallel coordinate buffers,
+        bypassing any per-vertex Python objects.
+        """
+        polygon = cls.__new__(cls)
+        polygon.indices = np.asarray(indices, dtype=np.int32)
+        polygon._xy = np.ascontiguousarray(np.column_stack((xs, ys)),
+                                           dtype=np.float64)
+        return polygon
+
+    @property
+    def points(self):
+        return _PointView(self._xy)
+
+    @property
+    def xs(self):
+        """
+        Read-only view of the x coordinates of all vertices. Numeric
+        kernels should prefer this (and :attr:`ys`) over iterating
+        ``points``: NumPy sweeps the whole column in one vectorized
+        pass, striding over the interleaved (N, 2) coordinate buffer
+        without any per-vertex Python dispatch.
+        """
+        xs = self._xy[:, 0]
+        xs.flags.writeable = False
+        return xs
+
+    @property
+    def ys(self):
+        """
+        Read-only view of the y coordinates of all vertices.
+        """
+        ys = self._xy[:, 1]
+        ys.flags.writeable = False
+        return ys
+
+    def bbox(self):
+        """
+        The bounding box (xmin, ymin, xmax, ymax) of this polygon,
+        computed as four vectorized reductions over the coordinate
+        columns.
+        """
+        xs = self._xy[:, 0]
+        ys = self._xy[:, 1]
+        return (xs.min(), ys.min(), xs.max(), ys.max())
 
     def __str__(self):
-        inds = "[" + ",".join([str(i) for i in self.indices]) + "]"
-        pts = "[" + ",".join([str(v) for v in self.points]) + "]"
-        return "Polygon (" + ",".join((inds, pts)) + ")"
+        inds = ",".join(map(str, self.indices.tolist()))
+        pts = ",".join(map(str, self.points))
+        return "Polygon ([%s],[%s])" % (inds, pts)
 
     def __repr__(self):
         return self.__str__()
 
-    def __reduce__(self):
-        return (Polygon, (self.indices, self.points))
+    def __eq__(self, other):
+        return self is other or \
+            (type(other) is Polygon and
+             np.array_equal(self.indices, other.indices) and
+             np.array_equal(self._xy, other._xy))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.indices.tobytes(), self._xy.tobytes()))
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return (Polygon._from_buffers,
+                    (self.indices, pickle.PickleBuffer(self._xy)))
+        return (Polygon, (self.indices, self._xy))
+
+    @staticmethod
+    def _from_buffers(indices, buf):
+        polygon = Polygon.__new__(Polygon)
+        polygon.indices = np.asarray(indices, dtype=np.int32)
+        polygon._xy = np.frombuffer(buf, dtype=np.float64).reshape(-1, 2)
+        return polygon
 
     @classmethod
     def fromJson(cls, json):
@@ -243,19 +515,15 @@ class Polygon(Shape):
         return Polygon(indices, points)
 
     def jsonValue(self):
-        return {"type": "udt",
-                "pyClass": "magellan.types.PolygonUDT",
-                "class": "magellan.Polygon",
-                "sqlType": "magellan.Polygon"}
+        Shape.registerPicklers()
+        return _POLYGON_JSON
 
     def convert(self):
-        l = []
-        l.extend(self.indices)
+        l = self.indices.tolist()
         l.append(len(self.points))
         p = []
         for i,j in zip(l, l[1:]):
-            spoints = [(point.x, point.y) for point in self.points[i:j - 1]]
-            p.append(spoints)
+            p.append(self._xy[i:j - 1])
 
         shell = p[0]
         holes = p[1:]
@@ -268,7 +536,7 @@ class PolyLineUDT(UserDefinedType):
     .. note:: WARN: SpatialSDK Internal Use Only
     """
 
-    pointUDT = PointUDT()
+    pointUDT = _POINT_UDT
 
     @classmethod
     def sqlType(cls):
@@ -295,21 +563,28 @@ class PolyLineUDT(UserDefinedType):
         """
         Converts the a user-type object into a SQL datum.
         """
-        if isinstance(obj, PolyLine):
+        if type(obj) is PolyLine:
             return obj
         else:
             raise TypeError("cannot serialize %r of type %r" % (obj, type(obj)))
 
-    def deserialize(self, datum):
+    def deserialize(self, datum, _len=len):
         """
         Converts a SQL datum into a user-type object.
         """
         if isinstance(datum, PolyLine):
             return datum
         else:
-            assert len(datum) == 2, \
-                "PolyLineUDT.deserialize given row with length %d but requires 2" % len(datum)
-            return PolyLine(datum[0], [self.pointUDT.deserialize(point) for point in datum[1]])
+            if __debug__:
+                assert _len(datum) == 2, \
+                    "PolyLineUDT.deserialize given row with length %d but requires 2" % _len(datum)
+            points = datum[1]
+            if isinstance(points, (bytes, bytearray, memoryview)):
+                points = np.frombuffer(points, dtype=np.float64)
+            elif (_points_to_xy is not None and type(points) is list
+                    and len(points) > 0 and not isinstance(points[0], Point)):
+                points = _points_to_xy(points)
+            return PolyLine(datum[0], points)
 
     def simpleString(self):
         return 'polyline'
@@ -320,6 +595,57 @@ class PolyLineUDT(UserDefinedType):
         points = [PointUDT.fromJson(point) for point in json["points"]]
         return PolyLine(indices, points)
 
+    arrowExtensionName = "geoarrow.multilinestring"
+
+    @classmethod
+    def arrowType(cls):
+        """
+        The Arrow storage type for this UDT: a list of parts, each a
+        list of coordinate structs, per the geoarrow layout.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return pa.list_(pa.list_(PointUDT.arrowType()))
+
+    @classmethod
+    def arrowField(cls, name):
+        """
+        An Arrow field of this UDT's storage type, tagged with the
+        geoarrow extension name.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        return pa.field(name, cls.arrowType(),
+                        metadata={"ARROW:extension:name": cls.arrowExtensionName})
+
+    def toArrow(self, polylines):
+        """
+        Converts a :class:`PolyLineArray` or a sequence of polylines
+        into a nested Arrow list array, bypassing the per-row serialize
+        path.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        if not isinstance(polylines, PolyLineArray):
+            polylines = PolyLineArrayUDT().deserialize(
+                [(polyline.indices.tolist(), polyline._xy) for polyline in polylines])
+        return polylines.toArrow()
+
+    @classmethod
+    def fromArrow(cls, array):
+        """
+        Wraps a nested Arrow list array of polylines as a
+        :class:`PolyLineArray` without copying the underlying buffers.
+        """
+        if not _have_arrow:
+            raise TypeError("Cannot convert to Arrow type")
+        parts = array.values
+        coords = parts.values
+        return PolyLineArray(coords.field('x').to_numpy(zero_copy_only=True),
+                             coords.field('y').to_numpy(zero_copy_only=True),
+                             parts.offsets.to_numpy(zero_copy_only=True),
+                             array.offsets.to_numpy(zero_copy_only=True))
+
 
 class PolyLine(Shape):
     """
@@ -331,22 +657,95 @@ class PolyLine(Shape):
     Point([0], Point(1.0, 1.0), Point(1.0, -1.0), Point(1.0, 0.0))
     """
 
+    __slots__ = ('indices', '_xy')
+
     __UDT__ = PolyLineUDT()
 
-    def __init__(self, indices = [], points = []):
-        self.indices = indices
-        self.points = points
+    def __init__(self, indices = None, points = None):
+        self.indices = np.asarray(() if indices is None else indices,
+                                  dtype=np.int32)
+        self._xy = _as_xy(() if points is None else points)
+
+    @classmethod
+    def from_xy(cls, indices, xs, ys):
+        """
+        Builds a polyline directly from parallel coordinate buffers,
+        bypassing any per-vertex Python objects.
+        """
+        polyline = cls.__new__(cls)
+        polyline.indices = np.asarray(indices, dtype=np.int32)
+        polyline._xy = np.ascontiguousarray(np.column_stack((xs, ys)),
+                                            dtype=np.float64)
+        return polyline
+
+    @property
+    def points(self):
+        return _PointView(self._xy)
+
+    @property
+    def xs(self):
+        """
+        Read-only view of the x coordinates of all vertices. Numeric
+        kernels should prefer this (and :attr:`ys`) over iterating
+        ``points``: NumPy sweeps the whole column in one vectorized
+        pass, striding over the interleaved (N, 2) coordinate buffer
+        without any per-vertex Python dispatch.
+        """
+        xs = self._xy[:, 0]
+        xs.flags.writeable = False
+        return xs
+
+    @property
+    def ys(self):
+        """
+        Read-only view of the y coordinates of all vertices.
+        """
+        ys = self._xy[:, 1]
+        ys.flags.writeable = False
+        return ys
+
+    def bbox(self):
+        """
+        The bounding box (xmin, ymin, xmax, ymax) of this polyline,
+        computed as four vectorized reductions over the coordinate
+        columns.
+        """
+        xs = self._xy[:, 0]
+        ys = self._xy[:, 1]
+        return (xs.min(), ys.min(), xs.max(), ys.max())
 
     def __str__(self):
-        inds = "[" + ",".join([str(i) for i in self.indices]) + "]"
-        pts = "[" + ",".join([str(v) for v in self.points]) + "]"
-        return "Polygon (" + ",".join((inds, pts)) + ")"
+        inds = ",".join(map(str, self.indices.tolist()))
+        pts = ",".join(map(str, self.points))
+        return "PolyLine ([%s],[%s])" % (inds, pts)
 
     def __repr__(self):
         return self.__str__()
 
-    def __reduce__(self):
-        return (PolyLine, (self.indices, self.points))
+    def __eq__(self, other):
+        return self is other or \
+            (type(other) is PolyLine and
+             np.array_equal(self.indices, other.indices) and
+             np.array_equal(self._xy, other._xy))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.indices.tobytes(), self._xy.tobytes()))
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return (PolyLine._from_buffers,
+                    (self.indices, pickle.PickleBuffer(self._xy)))
+        return (PolyLine, (self.indices, self._xy))
+
+    @staticmethod
+    def _from_buffers(indices, buf):
+        polyline = PolyLine.__new__(PolyLine)
+        polyline.indices = np.asarray(indices, dtype=np.int32)
+        polyline._xy = np.frombuffer(buf, dtype=np.float64).reshape(-1, 2)
+        return polyline
 
     @classmethod
     def fromJson(cls, json):
@@ -355,33 +754,302 @@ class PolyLine(Shape):
         return PolyLine(indices, points)
 
     def jsonValue(self):
-        return {"type": "udt",
-                "pyClass": "magellan.types.PolyLineUDT",
-                "class": "magellan.PolyLine",
-                "sqlType": "magellan.PolyLine"}
+        Shape.registerPicklers()
+        return _POLYLINE_JSON
 
     def convert(self):
-        l = []
-        l.extend(self.indices)
+        l = self.indices.tolist()
         l.append(len(self.points))
         p = []
         for i,j in zip(l, l[1:]):
-            spoints = [(point.x, point.y) for point in self.points[i:j - 1]]
-            p.append(LineString(spoints))
+            p.append(LineString(self._xy[i:j - 1]))
         return MultiLineString(p)
 
 
-def _inbound_shape_converter(json_string):
-    j = json.loads(json_string)
-    shapeType = str(j["pyClass"])  # convert unicode to str
-    split = shapeType.rfind(".")
-    module = shapeType[:split]
-    shapeClass = shapeType[split+1:]
-    m = __import__(module, globals(), locals(), [shapeClass])
-    UDT = getattr(m, shapeClass)
+# The jsonValue of a UDT is the same constant for every instance, so it is
+# built once here instead of allocating a fresh dict per call. The dicts are
+# shared by every caller and must be treated as frozen; they stay plain dicts
+# (rather than MappingProxyType) because pyspark's DataType.json() feeds the
+# return value of jsonValue straight into json.dumps, which only accepts
+# dict instances. The pre-encoded blobs let consumers that immediately
+# json-encode the schema skip the encoding entirely.
+_POINT_JSON = {"type": "udt",
+               "pyClass": "magellan.types.PointUDT",
+               "class": "magellan.PointUDT",
+               "sqlType": "magellan.Point"}
+_POINT_JSON_BYTES = json.dumps(_POINT_JSON, sort_keys=True).encode('utf-8')
+
+_POLYGON_JSON = {"type": "udt",
+                 "pyClass": "magellan.types.PolygonUDT",
+                 "class": "magellan.Polygon",
+                 "sqlType": "magellan.Polygon"}
+_POLYGON_JSON_BYTES = json.dumps(_POLYGON_JSON, sort_keys=True).encode('utf-8')
+
+_POLYLINE_JSON = {"type": "udt",
+                  "pyClass": "magellan.types.PolyLineUDT",
+                  "class": "magellan.PolyLine",
+                  "sqlType": "magellan.PolyLine"}
+_POLYLINE_JSON_BYTES = json.dumps(_POLYLINE_JSON, sort_keys=True).encode('utf-8')
+
+
+class PointArray(object):
+    """
+    A batch of points in GeoArrow struct-of-arrays layout.
+    The x and y coordinates of the whole batch live in two contiguous
+    float64 NumPy buffers instead of one Python object per point, so
+    downstream kernels can operate on the columns directly.
+    """
+
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Point(x, y) for x, y in zip(self.x[index], self.y[index])]
+        return Point(self.x[index], self.y[index])
+
+    def toArrow(self):
+        if _have_arrow:
+            return pa.StructArray.from_arrays(
+                [pa.array(self.x), pa.array(self.y)], names=['x', 'y'])
+        else:
+            raise TypeError("Cannot convert to Arrow type")
+
+
+class PolygonArray(object):
+    """
+    A batch of polygons in GeoArrow struct-of-arrays layout.
+    All vertex coordinates live in two contiguous float64 NumPy buffers,
+    with int32 offset buffers marking where each ring and each polygon
+    starts, instead of a Point object per vertex and a list per ring.
+    """
+
+    __slots__ = ('x', 'y', 'ring_offsets', 'geometry_offsets')
+
+    shape = Polygon
+
+    def __init__(self, x, y, ring_offsets, geometry_offsets):
+        self.x = x
+        self.y = y
+        self.ring_offsets = ring_offsets
+        self.geometry_offsets = geometry_offsets
+
+    def __len__(self):
+        return len(self.geometry_offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("batch index out of range")
+        rings = self.ring_offsets[self.geometry_offsets[index]:
+                                  self.geometry_offsets[index + 1] + 1]
+        begin, end = rings[0], rings[-1]
+        indices = [int(i - begin) for i in rings[:-1]]
+        return self.shape.from_xy(indices, self.x[begin:end], self.y[begin:end])
+
+    def toArrow(self):
+        if _have_arrow:
+            coords = pa.StructArray.from_arrays(
+                [pa.array(self.x), pa.array(self.y)], names=['x', 'y'])
+            rings = pa.ListArray.from_arrays(pa.array(self.ring_offsets), coords)
+            return pa.ListArray.from_arrays(pa.array(self.geometry_offsets), rings)
+        else:
+            raise TypeError("Cannot convert to Arrow type")
+
+
+class PolyLineArray(PolygonArray):
+    """
+    A batch of polylines in GeoArrow struct-of-arrays layout.
+    The layout is identical to :class:`PolygonArray` with the ring offsets
+    marking where each part starts.
+    """
+
+    __slots__ = ()
+
+    shape = None  # bound to PolyLine below, once it is defined
+
+
+class PointArrayUDT(object):
+    """Columnar deserializer for batches of point rows.
+
+    .. note:: WARN: SpatialSDK Internal Use Only
+    """
+
+    def deserialize(self, datums):
+        """
+        Converts a sequence of SQL point datums into a single
+        :class:`PointArray` backed by contiguous buffers.
+        """
+        xy = np.asarray(datums, dtype=np.float64).reshape(-1, 2)
+        return PointArray(np.ascontiguousarray(xy[:, 0]),
+                          np.ascontiguousarray(xy[:, 1]))
+
+
+class PolygonArrayUDT(object):
+    """Columnar deserializer for batches of polygon rows.
+
+    .. note:: WARN: SpatialSDK Internal Use Only
+    """
+
+    arrayType = PolygonArray
+
+    def deserialize(self, datums):
+        """
+        Converts a sequence of SQL polygon datums into a single
+        :class:`PolygonArray`, collapsing the per-vertex Python loop into
+        one contiguous coordinate buffer plus int32 offset buffers.
+        """
+        coords = []
+        ring_offsets = [0]
+        geometry_offsets = [0]
+        nvertices = 0
+        for indices, points in datums:
+            coords.append(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+            for start in list(indices)[1:]:
+                ring_offsets.append(nvertices + start)
+            nvertices += len(coords[-1])
+            ring_offsets.append(nvertices)
+            geometry_offsets.append(len(ring_offsets) - 1)
+        if coords:
+            xy = np.ascontiguousarray(np.concatenate(coords))
+        else:
+            xy = np.empty((0, 2), dtype=np.float64)
+        return self.arrayType(np.ascontiguousarray(xy[:, 0]),
+                              np.ascontiguousarray(xy[:, 1]),
+                              np.asarray(ring_offsets, dtype=np.int32),
+                              np.asarray(geometry_offsets, dtype=np.int32))
+
+
+class PolyLineArrayUDT(PolygonArrayUDT):
+    """Columnar deserializer for batches of polyline rows.
+
+    .. note:: WARN: SpatialSDK Internal Use Only
+    """
+
+    arrayType = PolyLineArray
+
+
+PolyLineArray.shape = PolyLine
+
+
+# Known shape UDTs, keyed by the pyClass recorded in their jsonValue, so
+# inbound conversion is a dict lookup instead of import machinery per row.
+_UDT_REGISTRY = {
+    "magellan.types.PointUDT": PointUDT,
+    "magellan.types.PolygonUDT": PolygonUDT,
+    "magellan.types.PolyLineUDT": PolyLineUDT,
+}
+
+
+def _inbound_shape_converter(json_string, _registry=_UDT_REGISTRY, _loads=json.loads):
+    j = _loads(json_string)
+    shapeType = str(j["pyClass"])
+    UDT = _registry.get(shapeType)
+    if UDT is None:
+        # UDT defined outside this module: fall back to a dynamic import
+        split = shapeType.rfind(".")
+        module = shapeType[:split]
+        shapeClass = shapeType[split+1:]
+        m = __import__(module, globals(), locals(), [shapeClass])
+        UDT = getattr(m, shapeClass)
     return UDT.fromJson(j)
 
 # This is used to unpickle a Row from JVM
 def _create_row_inbound_converter(dataType):
     return lambda *a: dataType.fromInternal(a)
 
+
+# Columnar counterparts of the per-row shape UDTs.
+_ARRAY_UDTS = {
+    PointUDT: PointArrayUDT,
+    PolygonUDT: PolygonArrayUDT,
+    PolyLineUDT: PolyLineArrayUDT,
+}
+
+
+def _batch_column(batch, name):
+    """
+    Returns the named column of an Arrow RecordBatch. Raises if the
+    column is absent: get_field_index returns -1 for unknown names, and
+    indexing with -1 would silently read the last column.
+    """
+    index = batch.schema.get_field_index(name)
+    if index < 0:
+        raise ValueError("RecordBatch has no column %r (columns: %s)"
+                         % (name, batch.schema.names))
+    return batch.column(index)
+
+
+def _create_batch_inbound_converter(dataType):
+    """
+    Returns a converter that deserializes a whole batch of rows at once
+    instead of dispatching per row. For the shape UDTs the result is the
+    matching columnar batch (:class:`PointArray`, :class:`PolygonArray`
+    or :class:`PolyLineArray`); an Arrow RecordBatch of points is
+    consumed zero-copy. Any other type falls back to the per-row
+    converter applied over the batch.
+    """
+    arrayUDTClass = _ARRAY_UDTS.get(type(dataType))
+    if arrayUDTClass is None:
+        converter = _create_row_inbound_converter(dataType)
+        return lambda rows: [converter(*row) for row in rows]
+    arrayUDT = arrayUDTClass()
+
+    def converter(batch):
+        if _have_arrow and isinstance(batch, pa.RecordBatch):
+            schema = batch.schema
+            if isinstance(dataType, PointUDT):
+                if 'x' in schema.names and 'y' in schema.names:
+                    xs = _batch_column(batch, 'x').to_numpy(zero_copy_only=True)
+                    ys = _batch_column(batch, 'y').to_numpy(zero_copy_only=True)
+                    return PointArray(xs, ys)
+                # geoarrow layout: a single struct<x, y> column
+                column = batch.column(0)
+                if batch.num_columns == 1 and pa.types.is_struct(column.type):
+                    return PointUDT.fromArrow(column)
+                raise ValueError("RecordBatch has neither x/y columns nor a "
+                                 "single struct column (columns: %s)"
+                                 % schema.names)
+            points = _batch_column(batch, 'points')
+            points_type = points.type
+            if (pa.types.is_list(points_type)
+                    and pa.types.is_list(points_type.value_type)
+                    and pa.types.is_struct(points_type.value_type.value_type)):
+                # geoarrow layout: offsets live in the list nesting
+                return type(dataType).fromArrow(points)
+            if (pa.types.is_list(points_type)
+                    and pa.types.is_struct(points_type.value_type)):
+                # one list of coordinate structs per row: adopt the coordinate
+                # buffers and rebuild offsets from the indices column plus the
+                # row boundaries
+                indices = _batch_column(batch, 'indices').to_pylist()
+                coords = points.values
+                row_offsets = points.offsets.to_numpy(zero_copy_only=True)
+                ring_offsets = [0]
+                geometry_offsets = [0]
+                for i, inds in enumerate(indices):
+                    begin = row_offsets[i]
+                    for start in list(inds)[1:]:
+                        ring_offsets.append(int(begin) + start)
+                    ring_offsets.append(int(row_offsets[i + 1]))
+                    geometry_offsets.append(len(ring_offsets) - 1)
+                return arrayUDT.arrayType(
+                    coords.field('x').to_numpy(zero_copy_only=True),
+                    coords.field('y').to_numpy(zero_copy_only=True),
+                    np.asarray(ring_offsets, dtype=np.int32),
+                    np.asarray(geometry_offsets, dtype=np.int32))
+            indices = _batch_column(batch, 'indices').to_pylist()
+            return arrayUDT.deserialize(zip(indices, points.to_pylist()))
+        return arrayUDT.deserialize(batch)
+
+    return converter
+
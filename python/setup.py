@@ -0,0 +1,42 @@
+#
+# Copyright 2015 Ram Sriharsha
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+    import numpy
+    # Extension names are given explicitly: the python/__init__.py in this
+    # directory would otherwise make cythonize infer a bogus 'python.'
+    # package prefix and break both build_ext --inplace and installs.
+    ext_modules = cythonize([
+        Extension("magellan._types", ["magellan/_types.pyx"]),
+        Extension("magellan._deserialize", ["magellan/_deserialize.pyx"]),
+    ])
+    for ext_module in ext_modules:
+        ext_module.include_dirs.append(numpy.get_include())
+except ImportError:
+    # No Cython in environment: ship the pure Python implementation.
+    ext_modules = []
+
+setup(
+    name='magellan',
+    version='1.0.5',
+    description='Python API for Magellan: Geospatial Analytics Using Spark',
+    packages=['magellan'],
+    install_requires=['numpy'],
+    ext_modules=ext_modules,
+)